@@ -343,14 +343,15 @@ def check_all_clusters():
         try:
             # [OIDC FIX] Force token refresh via kubectl before loading config
             print(f"INFO: Forcing token refresh for context '{context_name}' via kubectl...")
+            # stdout is discarded; only stderr is kept for the failure message below.
             subprocess.run(
                 ["kubectl", "config", "use-context", context_name],
-                check=True, capture_output=True, text=True
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
             )
             # Use a lightweight command to trigger auth flow
             subprocess.run(
                 ["kubectl", "get", "ns", "--request-timeout=10s"],
-                check=True, capture_output=True, text=True
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
             )
             print("INFO: Token refresh successful.")
             
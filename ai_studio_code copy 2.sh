@@ -229,13 +229,14 @@ def check_all_clusters():
                 api_client = client.CoreV1Api()
             else:
                 print(f"INFO: Forcing token refresh for context '{context_name}' via kubectl...")
+                # stdout is discarded; only stderr is kept for the failure message below.
                 subprocess.run(
                     ["kubectl", "config", "use-context", context_name],
-                    check=True, capture_output=True, text=True
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
                 )
                 subprocess.run(
                     ["kubectl", "get", "ns", "--request-timeout=10s"],
-                    check=True, capture_output=True, text=True
+                    check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
                 )
                 print("INFO: Token refresh successful.")
                 api_client = client.CoreV1Api(api_client=config.new_client_from_config(context=context_name))
@@ -208,8 +208,8 @@ flask==2.3.2
 flask-cors==4.0.0
 plotly==5.15.0
 maturin==1.2.3
-pandas==2.2.2
-openpyxl==3.1.2
+xlsxwriter==3.1.9
+orjson==3.9.10
 EOF
 
 # rust_analyzer/Cargo.toml
@@ -223,57 +223,85 @@ name = "rust_analyzer"
 crate-type = ["cdylib"]
 [dependencies]
 pyo3 = { version = "0.20", features = ["extension-module"] }
-serde = { version = "1.0", features = ["derive"] }
-serde_json = "1.0"
-chrono = { version = "0.4", features = ["serde"] }
 EOF
 
 # rust_analyzer/src/lib.rs
 cat << 'EOF' > rust_analyzer/src/lib.rs
 use pyo3::prelude::*;
-use serde::{Deserialize, Serialize};
 use std::collections::HashSet;
-#[derive(Serialize, Deserialize, Debug, Clone, Hash, Eq, PartialEq)]
-struct PodInfo { cluster: String, namespace: String, pod: String }
-#[derive(Serialize, Deserialize, Debug)]
-struct AnalysisResult { new: Vec<PodInfo>, ongoing: Vec<PodInfo>, resolved: Vec<PodInfo> }
+// Keys arrive as three parallel columns (cluster, namespace, pod) instead of JSON records.
+type KeyColumns = (Vec<String>, Vec<String>, Vec<String>);
+fn key_at(cols: &KeyColumns, i: usize) -> (&str, &str, &str) { (&cols.0[i], &cols.1[i], &cols.2[i]) }
+fn key_set(cols: &KeyColumns) -> HashSet<(&str, &str, &str)> { (0..cols.0.len()).map(|i| key_at(cols, i)).collect() }
+/// Returns (new, ongoing, resolved) as row indices into the today/today/yesterday columns, in input order.
 #[pyfunction]
-fn analyze_pod_changes(today_pods_str: String, yesterday_pods_str: String) -> PyResult<String> {
-    let today_pods: Vec<PodInfo> = serde_json::from_str(&today_pods_str).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
-    let yesterday_pods: Vec<PodInfo> = serde_json::from_str(&yesterday_pods_str).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
-    let today_set: HashSet<PodInfo> = today_pods.into_iter().collect();
-    let yesterday_set: HashSet<PodInfo> = yesterday_pods.into_iter().collect();
-    let result = AnalysisResult {
-        new: today_set.difference(&yesterday_set).cloned().collect(),
-        ongoing: today_set.intersection(&yesterday_set).cloned().collect(),
-        resolved: yesterday_set.difference(&today_set).cloned().collect(),
-    };
-    serde_json::to_string(&result).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+fn analyze_pod_keys(today: KeyColumns, yesterday: KeyColumns) -> (Vec<usize>, Vec<usize>, Vec<usize>) {
+    let today_set = key_set(&today);
+    let yesterday_set = key_set(&yesterday);
+    let (ongoing, new): (Vec<usize>, Vec<usize>) = (0..today.0.len()).partition(|&i| yesterday_set.contains(&key_at(&today, i)));
+    let resolved = (0..yesterday.0.len()).filter(|&i| !today_set.contains(&key_at(&yesterday, i))).collect();
+    (new, ongoing, resolved)
 }
 #[pymodule]
 fn rust_analyzer(_py: Python, m: &PyModule) -> PyResult<()> {
-    m.add_function(wrap_pyfunction!(analyze_pod_changes, m)?)?;
+    m.add_function(wrap_pyfunction!(analyze_pod_keys, m)?)?;
     Ok(())
 }
 EOF
 
 # main.py
 cat << 'EOF' > main.py
-import os, json, traceback, subprocess
+import os, time, traceback, threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
 try:
-    from kubernetes import client, config
-except ImportError: exit("FATAL: 'kubernetes' library not found. Please run build.sh or use Docker.")
+    import orjson
+except ImportError: exit("FATAL: 'orjson' library not found. Please run build.sh or use Docker.")
+
+# The kubernetes client is imported by warmup() on first use, so importing this module stays cheap.
+client = config = ApiException = None
+_warmup_lock = threading.Lock()
+
+def warmup():
+    # Call up front (CLI or web server start) to pay the kubernetes import once, before any scan.
+    global client, config, ApiException
+    with _warmup_lock:
+        if client is not None: return
+        try:
+            from kubernetes import client, config
+            from kubernetes.client.rest import ApiException
+        except ImportError: exit("FATAL: 'kubernetes' library not found. Please run build.sh or use Docker.")
 
 try:
-    from rust_analyzer import analyze_pod_changes
+    from rust_analyzer import analyze_pod_keys
     RUST_ACCELERATOR_ENABLED = True
 except ImportError:
     RUST_ACCELERATOR_ENABLED = False
 
+
 DATA_DIR, NORMAL_POD_PHASES = Path("data"), ["Succeeded", "Running"]
+MAX_SCAN_WORKERS = 32
+POD_LIST_PAGE_SIZE = 500
+RUST_MIN_PODS = 5000
+EVENT_CACHE_TTL_SECONDS, EVENT_ERROR_TTL_SECONDS, EVENT_FETCH_WORKERS = 60, 15, 16
+API_CONNECTION_POOL_SIZE = 10
+WATCH_TIMEOUT_SECONDS, WATCH_RETRY_SECONDS = 600, 30
+POD_CACHE_FILE = DATA_DIR / "pod_cache.json"
+# Succeeded pods never become abnormal again; Running pods still need the container-ready check.
+# One selector keeps each scan a single, snapshot-consistent paged list.
+POD_FIELD_SELECTOR = "status.phase!=Succeeded"
+_print_lock = threading.Lock()
+_event_cache, _event_cache_lock = {}, threading.Lock()
+_api_client_cache = {}
+_pod_caches, _pod_caches_lock, _pod_cache_seeds = {}, threading.Lock(), None
+_snapshot_cache, _snapshot_cache_lock = {"file": None, "mtime": None, "data": None}, threading.Lock()
+
+def log(message):
+    # Cluster scans run on worker threads; keep each message on its own line.
+    with _print_lock: print(message)
 
 def get_all_contexts():
     try:
@@ -284,139 +312,395 @@ def get_all_contexts():
     except Exception as e:
         print(f"ERROR: Could not list kubeconfig contexts: {e}"); return []
 
+def get_namespace_events(context_name, namespace):
+    # One API call per (context, namespace) serves every pod in it; results are reused for EVENT_CACHE_TTL_SECONDS.
+    # Failures are cached too (for EVENT_ERROR_TTL_SECONDS), so an unreachable namespace costs one timeout, not one per pod.
+    cache_key, now = (context_name, namespace), time.monotonic()
+    with _event_cache_lock:
+        cached = _event_cache.get(cache_key)
+    if cached:
+        fetched_at, events_by_pod, error = cached
+        if error is None and now - fetched_at < EVENT_CACHE_TTL_SECONDS: return events_by_pod
+        if error is not None and now - fetched_at < EVENT_ERROR_TTL_SECONDS: raise RuntimeError(error)
+    warmup()
+    log(f"INFO: Fetching pod events for namespace {namespace} in context {context_name}")
+    try:
+        # _preload_content=False skips model deserialization; the raw body has the same shape as 'kubectl get events -o json'.
+        response = call_with_reauth(context_name, lambda api: api.list_namespaced_event(namespace, field_selector="involvedObject.kind=Pod", _preload_content=False, _request_timeout=30))
+        events_by_pod = defaultdict(list)
+        for e in sorted(orjson.loads(response.data).get('items', []), key=lambda e: e.get('lastTimestamp') or '', reverse=True):
+            events_by_pod[e['involvedObject']['name']].append({"last_seen": e.get("lastTimestamp"), "type": e.get("type"), "reason": e.get("reason"), "message": e.get("message")})
+    except Exception as e:
+        with _event_cache_lock:
+            _event_cache[cache_key] = (now, None, str(e))
+        raise
+    with _event_cache_lock:
+        _event_cache[cache_key] = (now, events_by_pod, None)
+    return events_by_pod
+
+def prefetch_namespace_events(context_namespaces):
+    def fetch(context_namespace):
+        try: get_namespace_events(*context_namespace)
+        except Exception: pass  # get_pod_events reports the failure for each affected pod
+    with ThreadPoolExecutor(max_workers=EVENT_FETCH_WORKERS) as executor:
+        list(executor.map(fetch, set(context_namespaces)))
+
 def get_pod_events(context_name, namespace, pod_name):
-    print(f"INFO: Fetching events for {namespace}/{pod_name} in context {context_name}")
     try:
-        cmd = ["kubectl", "get", "events", "--namespace", namespace, "--field-selector", f"involvedObject.name={pod_name}", "-o", "json"]
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        events_data = json.loads(result.stdout)
-        sorted_events = sorted(events_data.get('items', []), key=lambda e: e.get('lastTimestamp', ''), reverse=True)
-        return [{"last_seen": e.get("lastTimestamp"), "type": e.get("type"), "reason": e.get("reason"), "message": e.get("message")} for e in sorted_events]
+        return get_namespace_events(context_name, namespace).get(pod_name, [])
     except Exception as e:
         error_msg = f"Failed to get pod events: {e}"
         print(f"ERROR: {error_msg}"); return [{"message": error_msg, "type": "Error"}]
 
+def list_pod_pages(api_client, field_selector):
+    # Pages are parsed straight from the response body with orjson; pods stay plain dicts (camelCase keys)
+    # instead of being built into V1Pod models.
+    _continue = None
+    while True:
+        response = api_client.list_pod_for_all_namespaces(watch=False, timeout_seconds=120, field_selector=field_selector, limit=POD_LIST_PAGE_SIZE, _continue=_continue, _preload_content=False)
+        page = orjson.loads(response.data)
+        yield page
+        _continue = page['metadata'].get('continue')
+        if not _continue: return
+
+def list_pods_paged(api_client, field_selector):
+    for page in list_pod_pages(api_client, field_selector): yield from page.get('items') or ()
+
+def pod_reasons(status, container_statuses):
+    reasons = set()
+    if status.get('reason'): reasons.add(status['reason'])
+    for cs in container_statuses:
+        state = cs.get('state') or {}
+        waiting, terminated = state.get('waiting'), state.get('terminated')
+        if waiting and waiting.get('reason'): reasons.add(waiting['reason'])
+        if terminated and terminated.get('reason'): reasons.add(terminated['reason'])
+        restart_count = cs.get('restartCount', 0)
+        if restart_count > 0: reasons.add(f"Restarts({restart_count})")
+    return ", ".join(sorted(reasons)) or "N/A"
+
+def abnormal_pod_record(pod, cluster_name, context_name):
+    # Returns the dashboard record for an abnormal pod (raw API dict), or None for a healthy one.
+    status = pod.get('status') or {}
+    pod_status = status.get('phase')
+    container_statuses = status.get('containerStatuses') or ()
+    if pod_status in NORMAL_POD_PHASES and not (pod_status == "Running" and not all(cs.get('ready') for cs in container_statuses)):
+        return None
+    metadata = pod['metadata']
+    namespace, name = metadata.get('namespace'), metadata.get('name')
+    return {
+        "timestamp": datetime.now().isoformat(), "cluster": cluster_name, "context_name": context_name, 
+        "namespace": namespace, "pod": name, "status": pod_status, 
+        "node": (pod.get('spec') or {}).get('nodeName') or "N/A", "reasons": pod_reasons(status, container_statuses),
+        "_key": (cluster_name, namespace, name)
+    }
+
 def check_abnormal_pods(api_client, cluster_name, context_name):
-    abnormal_pods = []
+    abnormal_pods, status_counts = [], Counter()
     try:
-        pods = api_client.list_pod_for_all_namespaces(watch=False, timeout_seconds=120)
-        for pod in pods.items:
-            is_abnormal = False
-            pod_status = pod.status.phase
-            if pod_status not in NORMAL_POD_PHASES or (pod_status == "Running" and pod.status.container_statuses and not all(cs.ready for cs in pod.status.container_statuses)):
-                is_abnormal = True
-            if is_abnormal:
-                reasons = []
-                if pod.status.reason: reasons.append(pod.status.reason)
-                if pod.status.container_statuses:
-                    for cs in pod.status.container_statuses:
-                        state = cs.state
-                        if state.waiting and state.waiting.reason: reasons.append(state.waiting.reason)
-                        if state.terminated and state.terminated.reason: reasons.append(state.terminated.reason)
-                        if cs.restart_count > 0: reasons.append(f"Restarts({cs.restart_count})")
-                abnormal_pods.append({
-                    "timestamp": datetime.now().isoformat(), "cluster": cluster_name, "context_name": context_name, 
-                    "namespace": pod.metadata.namespace, "pod": pod.metadata.name, "status": pod_status, 
-                    "node": pod.spec.node_name or "N/A", "reasons": ", ".join(sorted(list(set(reasons)))) or "N/A"
-                })
-        print(f"INFO: Scan for cluster '{cluster_name}' complete. Found {len(abnormal_pods)} abnormal pod(s).")
+        for pod in list_pods_paged(api_client, POD_FIELD_SELECTOR):
+            record = abnormal_pod_record(pod, cluster_name, context_name)
+            if record:
+                abnormal_pods.append(record)
+                status_counts[record['status']] += 1
+        log(f"INFO: Scan for cluster '{cluster_name}' complete. Found {len(abnormal_pods)} abnormal pod(s).")
+    except ApiException as e:
+        if e.status == 401: raise  # expired credentials: let call_with_reauth rebuild the client and rescan
+        log(f"ERROR: Pod scan failed in cluster '{cluster_name}': {e}")
     except Exception as e:
-        print(f"ERROR: Pod scan failed in cluster '{cluster_name}': {e}")
-    return abnormal_pods
+        log(f"ERROR: Pod scan failed in cluster '{cluster_name}': {e}")
+    return abnormal_pods, status_counts
+
+class PodWatchCache:
+    # Keeps one cluster's abnormal pods current from a list + watch stream, so periodic scans read
+    # memory instead of re-listing every pod. A 410 Gone from the watch triggers a full re-list.
+    # A seed (from pod_cache.json) only counts as synced once the watch resumes from its resourceVersion.
+    def __init__(self, context_name, cluster_name, seed=None):
+        self.context_name, self.cluster_name = context_name, cluster_name
+        self.lock, self.synced = threading.Lock(), threading.Event()
+        self.pods, self.resource_version, self.error = {}, None, None
+        if seed:
+            for p in seed['pods']: p['_key'] = (p['cluster'], p['namespace'], p['pod'])
+            self.pods = {(p['namespace'], p['pod']): p for p in seed['pods']}
+            self.resource_version = seed['resource_version']
+        threading.Thread(target=self._run, name=f"pod-watch-{context_name}", daemon=True).start()
+
+    def _mark_synced(self):
+        self.error = None; self.synced.set()
+
+    def snapshot(self):
+        with self.lock: return list(self.pods.values()), self.resource_version
+
+    def _relist(self, api_client):
+        pods, resource_version = {}, None
+        for page in list_pod_pages(api_client, POD_FIELD_SELECTOR):
+            resource_version = resource_version or page['metadata'].get('resourceVersion')
+            for pod in page.get('items') or ():
+                record = abnormal_pod_record(pod, self.cluster_name, self.context_name)
+                if record: pods[(record['namespace'], record['pod'])] = record
+        with self.lock: self.pods, self.resource_version = pods, resource_version
+        self._mark_synced()
+        log(f"INFO: Pod cache for cluster '{self.cluster_name}' synced. Found {len(pods)} abnormal pod(s).")
+
+    def _stream_events(self, api_client):
+        # Reads the watch response line by line with orjson; unlike watch.Watch().stream(), no V1Pod is built per event.
+        response = api_client.list_pod_for_all_namespaces(watch=True, allow_watch_bookmarks=True, field_selector=POD_FIELD_SELECTOR, resource_version=self.resource_version, timeout_seconds=WATCH_TIMEOUT_SECONDS, _preload_content=False)
+        try:
+            for line in response:
+                if not line.strip(): continue
+                event = orjson.loads(line)
+                if event['type'] == "ERROR":
+                    status = event['object']
+                    raise ApiException(status=status.get('code'), reason=f"{status.get('reason')}: {status.get('message')}")
+                # A too-old resourceVersion is answered with an immediate 410 ERROR event, so the first
+                # real event (or bookmark, or a clean end of the watch) confirms a seed is being kept current.
+                self._mark_synced()
+                yield event
+            self._mark_synced()
+        finally:
+            response.close(); response.release_conn()
+
+    def _run(self):
+        while True:
+            try:
+                api_client = get_core_api(self.context_name)
+                if self.resource_version is None: self._relist(api_client)
+                for event in self._stream_events(api_client):
+                    pod = event['object']
+                    metadata = pod['metadata']
+                    if event['type'] == "BOOKMARK":
+                        with self.lock: self.resource_version = metadata.get('resourceVersion')
+                        continue
+                    record = None if event['type'] == "DELETED" else abnormal_pod_record(pod, self.cluster_name, self.context_name)
+                    with self.lock:
+                        if record: self.pods[(record['namespace'], record['pod'])] = record
+                        else: self.pods.pop((metadata.get('namespace'), metadata.get('name')), None)
+                        self.resource_version = metadata.get('resourceVersion')
+            except ApiException as e:
+                if e.status == 410:
+                    log(f"INFO: Pod watch for cluster '{self.cluster_name}' expired. Re-listing.")
+                    with self.lock: self.resource_version = None
+                    continue
+                if e.status == 401: drop_core_api(self.context_name)
+                self.error = e
+                log(f"ERROR: Pod watch failed in cluster '{self.cluster_name}': {e}. Retrying in {WATCH_RETRY_SECONDS}s.")
+                time.sleep(WATCH_RETRY_SECONDS)
+            except Exception as e:
+                self.error = e
+                log(f"ERROR: Pod watch failed in cluster '{self.cluster_name}': {e}. Retrying in {WATCH_RETRY_SECONDS}s.")
+                time.sleep(WATCH_RETRY_SECONDS)
+
+def new_core_api(context_name):
+    # Each context gets its own Configuration, so nothing touches the shared current-context.
+    # The kubeconfig loader refreshes OIDC tokens and runs exec auth plugins in-process.
+    configuration = client.Configuration()
+    if context_name == "in-cluster":
+        config.load_incluster_config(client_configuration=configuration)
+    else:
+        config.load_kube_config(context=context_name, client_configuration=configuration, persist_config=False)
+    configuration.connection_pool_maxsize = API_CONNECTION_POOL_SIZE
+    return client.CoreV1Api(api_client=client.ApiClient(configuration))
+
+def get_core_api(context_name):
+    # One ApiClient per context is reused across scans so its urllib3 pool keeps TLS connections alive.
+    api = _api_client_cache.get(context_name)
+    if api is None: api = _api_client_cache.setdefault(context_name, new_core_api(context_name))
+    return api
+
+def drop_core_api(context_name):
+    _api_client_cache.pop(context_name, None)
 
-def check_all_clusters():
-    all_abnormal_pods = []
+def call_with_reauth(context_name, request):
+    # Cached clients keep the token they were built with; on 401, rebuild the client once and retry.
+    try:
+        return request(get_core_api(context_name))
+    except ApiException as e:
+        if e.status != 401: raise
+        log(f"INFO: Credentials for context '{context_name}' rejected. Reloading kubeconfig and retrying.")
+        drop_core_api(context_name)
+        return request(get_core_api(context_name))
+
+def _scan_one_context(context_info):
+    context_name, cluster_name = context_info['name'], context_info['context'].get('cluster', context_info['name'])
+    log(f"\n--- Checking Cluster: '{cluster_name}' (Context: '{context_name}') ---")
+    return call_with_reauth(context_name, lambda api: check_abnormal_pods(api, cluster_name, context_name))
+
+def _load_pod_cache_seeds():
+    if not POD_CACHE_FILE.exists(): return {}
+    try:
+        with open(POD_CACHE_FILE, "rb") as f: return orjson.loads(f.read())
+    except Exception as e:
+        print(f"ERROR: Could not read pod cache {POD_CACHE_FILE}: {e}"); return {}
+
+def save_pod_caches():
+    with _pod_caches_lock: caches = dict(_pod_caches)
+    snapshot = {}
+    for context_name, cache in caches.items():
+        pods, resource_version = cache.snapshot()
+        if resource_version: snapshot[context_name] = {"resource_version": resource_version, "pods": strip_keys(pods)}
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    temp_filename = POD_CACHE_FILE.with_suffix(".tmp")
+    try:
+        with open(temp_filename, "wb") as f: f.write(orjson.dumps(snapshot))
+        os.replace(temp_filename, POD_CACHE_FILE)
+    except IOError as e: print(f"ERROR: Could not write pod cache {POD_CACHE_FILE}: {e}")
+
+def _read_pod_cache(context_info):
+    global _pod_cache_seeds
+    context_name, cluster_name = context_info['name'], context_info['context'].get('cluster', context_info['name'])
+    with _pod_caches_lock:
+        cache = _pod_caches.get(context_name)
+        if cache is None:
+            if _pod_cache_seeds is None: _pod_cache_seeds = _load_pod_cache_seeds()
+            log(f"INFO: Starting pod watch for cluster '{cluster_name}' (Context: '{context_name}')")
+            cache = _pod_caches[context_name] = PodWatchCache(context_name, cluster_name, _pod_cache_seeds.pop(context_name, None))
+    # Wait out a slow initial list rather than reporting the cluster as empty (its pods would show as resolved).
+    # If the first attempt fails, fall back to the seed as-is, with its original timestamps, or fail the context.
+    while not cache.synced.wait(1):
+        if cache.error is None: continue
+        pods, resource_version = cache.snapshot()
+        if not resource_version: raise RuntimeError(f"pod cache has not synced: {cache.error}")
+        log(f"WARNING: Pod watch for cluster '{cluster_name}' not resumed yet; reporting {len(pods)} pod(s) from the saved cache.")
+        return pods, Counter(p['status'] for p in pods)
+    # Cached records carry the time their watch event arrived; stamp copies with this scan's time instead.
+    pods, scanned_at = cache.snapshot()[0], datetime.now().isoformat()
+    pods = [{**p, "timestamp": scanned_at} for p in pods]
+    return pods, Counter(p['status'] for p in pods)
+
+def check_all_clusters(use_watch=False):
+    # Returns (pods, status_counts, cluster_counts); the histograms are accumulated during the scan itself.
+    # use_watch serves long-running callers from per-cluster PodWatchCaches instead of listing every pod each time.
+    all_abnormal_pods, status_counts, cluster_counts = [], Counter(), Counter()
+    warmup()
     contexts = get_all_contexts()
-    if not contexts: return []
+    if not contexts: return all_abnormal_pods, status_counts, cluster_counts
     print(f"INFO: Found {len(contexts)} contexts. Starting scan...")
-    for context_info in contexts:
-        context_name, cluster_name = context_info['name'], context_info['context'].get('cluster', context_info['name'])
-        print(f"\n--- Checking Cluster: '{cluster_name}' (Context: '{context_name}') ---")
-        try:
-            print(f"INFO: Forcing token refresh for context '{context_name}' via kubectl...")
-            subprocess.run(["kubectl", "config", "use-context", context_name], check=True, capture_output=True, text=True)
-            subprocess.run(["kubectl", "get", "ns", "--request-timeout=10s"], check=True, capture_output=True, text=True)
-            print("INFO: Token refresh successful.")
-            api_client = client.CoreV1Api(api_client=config.new_client_from_config(context=context_name))
-            all_abnormal_pods.extend(check_abnormal_pods(api_client, cluster_name, context_name))
-        except Exception as e:
-            print(f"ERROR: Failed to process context '{context_name}'. Skipping. Reason: {e}")
-    return all_abnormal_pods
+    scan = _read_pod_cache if use_watch else _scan_one_context
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(contexts))) as executor:
+        futures = {executor.submit(scan, context_info): context_info['name'] for context_info in contexts}
+        for future in as_completed(futures):
+            try:
+                cluster_pods, cluster_status_counts = future.result()
+            except Exception as e:
+                log(f"ERROR: Failed to process context '{futures[future]}'. Skipping. Reason: {e}"); continue
+            all_abnormal_pods.extend(cluster_pods)
+            status_counts += cluster_status_counts
+            if cluster_pods: cluster_counts[cluster_pods[0]['cluster']] += len(cluster_pods)
+    if use_watch: save_pod_caches()
+    return all_abnormal_pods, status_counts, cluster_counts
+
+def strip_keys(pods):
+    # '_key' is an in-memory identity cache; it is rebuilt on load rather than stored.
+    return [{k: v for k, v in p.items() if k != "_key"} for p in pods]
 
 def save_to_file(pods, date):
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     filename = DATA_DIR / f"abnormal_pods_{date.strftime('%Y%m%d')}.json"
+    temp_filename = filename.with_suffix(".tmp")
     try:
-        with open(filename, "w", encoding="utf-8") as f: json.dump(pods, f, indent=2, ensure_ascii=False)
+        # Written to a temp file and swapped in, so a reader never sees a half-written snapshot.
+        with open(temp_filename, "wb") as f:
+            f.write(orjson.dumps(strip_keys(pods), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            f.flush(); os.fsync(f.fileno())
+        os.replace(temp_filename, filename)
         print(f"\nINFO: Successfully saved aggregated data to {filename}")
     except IOError as e: print(f"ERROR: Could not write to file {filename}: {e}")
 
 def load_from_file(date):
+    # Parsed snapshots are cached per file and reused until its mtime changes; yesterday's file is
+    # re-read every cycle but only parsed once. The returned list is shared, so callers must not mutate it.
     filename = DATA_DIR / f"abnormal_pods_{date.strftime('%Y%m%d')}.json"
-    if not filename.exists(): return []
+    try: mtime = filename.stat().st_mtime_ns
+    except FileNotFoundError: return []
+    with _snapshot_cache_lock:
+        if _snapshot_cache["file"] == filename and _snapshot_cache["mtime"] == mtime: return _snapshot_cache["data"]
     try:
-        with open(filename, "r", encoding="utf-8") as f: return json.load(f)
+        with open(filename, "rb") as f: pods = orjson.loads(f.read())
+        for p in pods: p['_key'] = (p['cluster'], p['namespace'], p['pod'])
     except Exception as e:
         print(f"ERROR: Could not read file {filename}: {e}"); return []
+    with _snapshot_cache_lock: _snapshot_cache.update(file=filename, mtime=mtime, data=pods)
+    return pods
+
+def index_by_key(pods):
+    return {p['_key']: p for p in pods}
 
 def analyze_changes_python(today_pods, yesterday_pods):
     print("\n" + "="*50); print("🐍          ANALYZING IN PURE PYTHON MODE           🐍"); print("="*50)
-    today_set = {(p['cluster'], p['namespace'], p['pod']) for p in today_pods}
-    yesterday_set = {(p['cluster'], p['namespace'], p['pod']) for p in yesterday_pods}
+    today_map, yesterday_map = index_by_key(today_pods), index_by_key(yesterday_pods)
     return {
-        "new": [p for p in today_pods if (p['cluster'], p['namespace'], p['pod']) not in yesterday_set],
-        "ongoing": [p for p in today_pods if (p['cluster'], p['namespace'], p['pod']) in yesterday_set],
-        "resolved": [p for p in yesterday_pods if (p['cluster'], p['namespace'], p['pod']) not in today_set]
+        "new": [p for k, p in today_map.items() if k not in yesterday_map],
+        "ongoing": [p for k, p in today_map.items() if k in yesterday_map],
+        "resolved": [p for k, p in yesterday_map.items() if k not in today_map]
     }
 
+def key_columns(pods):
+    keys = [p['_key'] for p in pods]
+    return [k[0] for k in keys], [k[1] for k in keys], [k[2] for k in keys]
+
 def analyze_changes(today_pods, yesterday_pods):
-    if not RUST_ACCELERATOR_ENABLED:
-        return analyze_changes_python(today_pods, yesterday_pods)
-    try:
-        print("\n" + "="*50); print("🚀        ANALYZING WITH RUST ACCELERATOR        🚀"); print("="*50)
-        today_key_only = [{"cluster": p["cluster"], "namespace": p["namespace"], "pod": p["pod"]} for p in today_pods]
-        yesterday_key_only = [{"cluster": p["cluster"], "namespace": p["namespace"], "pod": p["pod"]} for p in yesterday_pods]
-        
-        result = json.loads(analyze_pod_changes(json.dumps(today_key_only), json.dumps(yesterday_key_only)))
-        new_keys = {tuple(p.values()) for p in result['new']}
-        ongoing_keys = {tuple(p.values()) for p in result['ongoing']}
-        resolved_keys = {tuple(p.values()) for p in result['resolved']}
-        
-        return {
-            "new": [p for p in today_pods if (p['cluster'], p['namespace'], p['pod']) in new_keys],
-            "ongoing": [p for p in today_pods if (p['cluster'], p['namespace'], p['pod']) in ongoing_keys],
-            "resolved": [p for p in yesterday_pods if (p['cluster'], p['namespace'], p['pod']) in resolved_keys]
-        }
-    except Exception as e:
-        print(f"\nWARNING: Rust accelerator failed: {e}. Falling back to Python."); return analyze_changes_python(today_pods, yesterday_pods)
+    total_pods = len(today_pods) + len(yesterday_pods)
+    # For small snapshots, handing the keys to Rust costs more than the dict join itself.
+    if RUST_ACCELERATOR_ENABLED and total_pods >= RUST_MIN_PODS:
+        try:
+            print("\n" + "="*50); print("🚀        ANALYZING WITH RUST ACCELERATOR        🚀"); print("="*50)
+            # The kernel returns one index per row; collapse duplicate keys first, as the Python dict join does.
+            today_pods, yesterday_pods = list(index_by_key(today_pods).values()), list(index_by_key(yesterday_pods).values())
+            new_idx, ongoing_idx, resolved_idx = analyze_pod_keys(key_columns(today_pods), key_columns(yesterday_pods))
+            return {
+                "new": [today_pods[i] for i in new_idx],
+                "ongoing": [today_pods[i] for i in ongoing_idx],
+                "resolved": [yesterday_pods[i] for i in resolved_idx]
+            }
+        except Exception as e:
+            print(f"\nWARNING: Rust accelerator failed: {e}. Falling back to Python.")
+    return analyze_changes_python(today_pods, yesterday_pods)
 
 if __name__ == "__main__":
     print("--- Kubernetes Pod Monitor (CLI Mode) ---")
-    today_abnormal_pods = check_all_clusters()
+    warmup()
+    today_abnormal_pods, _, _ = check_all_clusters()
     save_to_file(today_abnormal_pods, datetime.now())
     print("\n--- CLI run finished. ---")
 EOF
 
 # web_server.py
 cat << 'EOF' > web_server.py
-import threading, time, json, io
+import threading, time, io
 from datetime import datetime, timedelta
-import pandas as pd
+import orjson
 from flask import Flask, render_template, jsonify, request, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from main import check_all_clusters, save_to_file, load_from_file, analyze_changes, get_pod_events
+import main
+from main import check_all_clusters, save_to_file, load_from_file, analyze_changes, get_pod_events, prefetch_namespace_events
+
+class OrjsonProvider(JSONProvider):
+    # jsonify() serializes the full pod lists on every poll; orjson is several times faster than stdlib json.
+    def dumps(self, obj, **kwargs): return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    def loads(self, s, **kwargs): return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 background_task_lock, background_thread_status, cached_data = threading.Lock(), {"running": False, "last_run": "Never", "last_result": "N/A"}, {}
+SCAN_INTERVAL_SECONDS, cached_at = 600, 0.0  # cached_at: time.monotonic() of the last published snapshot
+EXCEL_COLUMNS = ['cluster', 'namespace', 'pod', 'node', 'status', 'reasons', 'detailed_events', 'timestamp']
 
 @app.route('/')
 def dashboard(): return render_template('dashboard.html')
 
 @app.route('/api/data')
 def get_api_data():
-    if not cached_data: run_monitor_check()
-    return jsonify({**cached_data, 'background_status': background_thread_status})
+    # Always answer from the current snapshot; before the first scan finishes, start one and report warming.
+    # A stale snapshot is still served, but kicks off a background refresh (a no-op if one is running).
+    data = cached_data
+    if not data:
+        trigger_monitor_check()
+        return jsonify({"status": "warming", "background_status": background_thread_status}), 202
+    if time.monotonic() - cached_at > SCAN_INTERVAL_SECONDS: trigger_monitor_check()
+    response = jsonify({**data, 'background_status': background_thread_status})
+    response.headers['Cache-Control'] = 'max-age=30'
+    return response
 
 @app.route('/api/pod/events')
 def pod_events_api():
@@ -429,25 +713,21 @@ def download_excel():
     if not cached_data: return "No data available, please refresh.", 404
     
     todays_issues = cached_data['lists']['new'] + cached_data['lists']['ongoing']
+    prefetch_namespace_events((pod['context_name'], pod['namespace']) for pod in todays_issues)
     
-    # Add detailed events to each pod record for the Excel file
-    all_pod_details = []
-    for pod in todays_issues:
-        pod_details = pod.copy()
+    import xlsxwriter
+
+    # Rows are written straight into the workbook; constant_memory flushes each row instead of holding the sheet.
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True, 'strings_to_urls': False})
+    worksheet = workbook.add_worksheet('Abnormal_Pods')
+    worksheet.write_row(0, 0, EXCEL_COLUMNS, workbook.add_format({'bold': True}))
+    for row, pod in enumerate(todays_issues, start=1):
         events = get_pod_events(pod['context_name'], pod['namespace'], pod['pod'])
         event_strings = [f"[{e.get('last_seen', 'N/A')}] ({e.get('type', 'N/A')}) {e.get('reason', 'N/A')}: {e.get('message', 'N/A')}" for e in events]
-        pod_details['detailed_events'] = "\n".join(event_strings) if event_strings else "No events found."
-        all_pod_details.append(pod_details)
-        
-    if not all_pod_details:
-        df = pd.DataFrame(columns=['cluster', 'namespace', 'pod', 'node', 'status', 'reasons', 'detailed_events', 'timestamp'])
-    else:
-        df = pd.DataFrame(all_pod_details)
-        # Reorder columns for the final Excel output
-        df = df[['cluster', 'namespace', 'pod', 'node', 'status', 'reasons', 'detailed_events', 'timestamp']]
-    
-    output = io.BytesIO()
-    df.to_excel(output, index=False, sheet_name='Abnormal_Pods')
+        detailed_events = "\n".join(event_strings) if event_strings else "No events found."
+        worksheet.write_row(row, 0, (pod['cluster'], pod['namespace'], pod['pod'], pod['node'], pod['status'], pod['reasons'], detailed_events, pod['timestamp']))
+    workbook.close()
     output.seek(0)
     
     filename = f"abnormal_pods_{datetime.now().strftime('%Y-%m-%d')}.xlsx"
@@ -456,48 +736,69 @@ def download_excel():
 
 @app.route('/api/run-check', methods=['POST'])
 def force_run_check():
-    if background_task_lock.locked(): return jsonify({"status": "error", "message": "Scan in progress."}), 429
-    threading.Thread(target=run_monitor_check).start()
+    if not trigger_monitor_check(): return jsonify({"status": "error", "message": "Scan in progress."}), 429
     return jsonify({"status": "success", "message": "New scan initiated."})
 
+def trigger_monitor_check():
+    # Starts a scan in the background and returns immediately; False if a scan already holds the lock.
+    if not background_task_lock.acquire(blocking=False): return False
+    def run_and_release():
+        try: _run_monitor_check_locked()
+        finally: background_task_lock.release()
+    threading.Thread(target=run_and_release, daemon=True).start()
+    return True
+
 def run_monitor_check():
-    with background_task_lock:
-        print("INFO: Acquiring lock for monitor check...")
-        background_thread_status["running"] = True
-        today = datetime.now()
-        try:
-            today_pods = check_all_clusters()
-            save_to_file(today_pods, today)
-        except Exception as e:
-            background_thread_status.update({"last_result": f"Failed: {e}", "running": False}); return
-        
-        global cached_data
-        cached_data = format_data_for_dashboard(today_pods, analyze_changes(today_pods, load_from_file(today - timedelta(days=1))))
-        background_thread_status.update({"last_run": today.strftime('%Y-%m-%d %H:%M:%S'), "last_result": "Success", "running": False})
-        print("INFO: Monitor check completed.")
-
-def format_data_for_dashboard(today_pods, analysis):
-    status_counts, cluster_counts = {}, {}
-    for pod in today_pods:
-        status_counts[pod['status']] = status_counts.get(pod['status'], 0) + 1
-        cluster_counts[pod['cluster']] = cluster_counts.get(pod['cluster'], 0) + 1
+    with background_task_lock: _run_monitor_check_locked()
+
+def _run_monitor_check_locked():
+    print("INFO: Acquiring lock for monitor check...")
+    background_thread_status["running"] = True
+    today = datetime.now()
+    try:
+        today_pods, status_counts, cluster_counts = check_all_clusters(use_watch=True)
+        save_to_file(today_pods, today)
+    except Exception as e:
+        background_thread_status.update({"last_result": f"Failed: {e}", "running": False}); return
+    
+    # Build the new snapshot completely, then publish it with a single reference assignment:
+    # readers see either the previous snapshot or this one, never a half-built dict.
+    global cached_data, cached_at
+    analysis = analyze_changes(today_pods, load_from_file(today - timedelta(days=1)))
+    cached_data = format_data_for_dashboard(today_pods, analysis, status_counts, cluster_counts)
+    cached_at = time.monotonic()
+    background_thread_status.update({"last_run": today.strftime('%Y-%m-%d %H:%M:%S'), "last_result": "Success", "running": False})
+    print("INFO: Monitor check completed.")
+
+def chart_series(counts):
+    # most_common() sorts in C, so bars and pie slices come out largest first.
+    ranked = counts.most_common()
+    return {"labels": [label for label, _ in ranked], "values": [value for _, value in ranked]}
+
+def format_data_for_dashboard(today_pods, analysis, status_counts, cluster_counts):
     return {
         "stats": {"total": len(today_pods), "new": len(analysis['new']), "ongoing": len(analysis['ongoing']), "resolved": len(analysis['resolved'])},
         "lists": analysis,
         "charts": {
-            "status_distribution": {"labels": list(status_counts.keys()), "values": list(status_counts.values())},
-            "cluster_distribution": {"labels": list(cluster_counts.keys()), "values": list(cluster_counts.values())}
+            "status_distribution": chart_series(status_counts),
+            "cluster_distribution": chart_series(cluster_counts)
         }, "last_updated": datetime.now().isoformat()
     }
 
+def warmup():
+    # Imports the heavy modules (kubernetes client, xlsxwriter) at startup instead of on the first request.
+    import xlsxwriter  # noqa: F401
+    main.warmup()
+
 def background_scheduler():
     print("INFO: Background scheduler started.")
     while True:
-        run_monitor_check(); time.sleep(600)
+        run_monitor_check(); time.sleep(SCAN_INTERVAL_SECONDS)
 
 if __name__ == '__main__':
     port = 5000
-    run_monitor_check()
+    warmup()
+    # The scheduler runs the first scan right away; /api/data reports warming until it finishes.
     threading.Thread(target=background_scheduler, daemon=True).start()
     print(f"INFO: Starting Flask web server on http://0.0.0.0:{port}")
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -512,8 +813,8 @@ cat << 'EOF' > templates/dashboard.html
     let eventsHtml=events.map(e=>{const typeClass=e.type==="Warning"?"text-danger":"text-muted",time=e.last_seen?new Date(e.last_seen).toLocaleString():"N/A";return`<div class="event-item"><p class="mb-1"><strong>${e.reason||"N/A"}</strong> <span class="${typeClass}">(${e.type||"N/A"})</span></p><p class="mb-1 small">${e.message||""}</p><p class="mb-0 text-muted small">Last Seen: ${time}</p></div>`}).join("");modalBody.innerHTML=eventsHtml}catch(error){console.error("Failed to fetch pod events:",error);modalBody.innerHTML=`<div class="alert alert-danger">Failed to load events. ${error.message}</div>`}}
     function updateUI(data){for(const key of["total","new","ongoing","resolved"]){document.getElementById(`stat-${key}`).textContent=data.stats[key];if(key!=="total")document.getElementById(`badge-${key}`).textContent=data.stats[key]}
     for(const key of["new","ongoing","resolved"])document.getElementById(`table-body-${key}`).innerHTML=data.lists[key].map(createTableRow).join("");const chartLayout={margin:{l:40,r:20,t:40,b:20},height:300};Plotly.newPlot("chart-status-distribution",[{labels:data.charts.status_distribution.labels,values:data.charts.status_distribution.values,type:"pie",hole:.4}],chartLayout,{responsive:!0,displaylogo:!1});Plotly.newPlot("chart-cluster-distribution",[{x:data.charts.cluster_distribution.labels,y:data.charts.cluster_distribution.values,type:"bar",marker:{color:"#0d6efd"}}],chartLayout,{responsive:!0,displaylogo:!1});document.getElementById("last-updated").textContent=new Date(data.last_updated).toLocaleString();if(data.background_status)document.getElementById("background-status").textContent=`${data.background_status.last_run} (${data.background_status.last_result})`}
-    async function fetchData(){try{const response=await fetch(G.API_URL);if(!response.ok)throw new Error(`HTTP error! status: ${response.status}`);updateUI(await response.json())}catch(error){console.error("Failed to fetch data:",error);alert("Failed to load dashboard data. Check server logs.")}}
-    async function forceRefresh(){showSpinner();document.getElementById("force-refresh-btn").disabled=!0;try{const response=await fetch(G.REFRESH_URL,{method:"POST"}),result=await response.json();if(!response.ok)throw new Error(result.message||"Failed to start refresh.");alert(result.message);setTimeout(()=>fetchData().finally(()=>{hideSpinner();document.getElementById("force-refresh-btn").disabled=!1}),3e3)}catch(error){console.error("Failed to force refresh:",error);alert(`Error: ${error.message}`);hideSpinner();document.getElementById("force-refresh-btn").disabled=!1}}
+    async function fetchData(options){try{const response=await fetch(G.API_URL,options);if(!response.ok)throw new Error(`HTTP error! status: ${response.status}`);if(response.status===202){document.getElementById("background-status").textContent="Initial scan in progress...";setTimeout(fetchData,5e3);return}updateUI(await response.json())}catch(error){console.error("Failed to fetch data:",error);alert("Failed to load dashboard data. Check server logs.")}}
+    async function forceRefresh(){showSpinner();document.getElementById("force-refresh-btn").disabled=!0;try{const response=await fetch(G.REFRESH_URL,{method:"POST"}),result=await response.json();if(!response.ok)throw new Error(result.message||"Failed to start refresh.");alert(result.message);setTimeout(()=>fetchData({cache:"no-cache"}).finally(()=>{hideSpinner();document.getElementById("force-refresh-btn").disabled=!1}),3e3)}catch(error){console.error("Failed to force refresh:",error);alert(`Error: ${error.message}`);hideSpinner();document.getElementById("force-refresh-btn").disabled=!1}}
     document.addEventListener("DOMContentLoaded",()=>{showSpinner();fetchData().finally(hideSpinner);setInterval(fetchData,6e4);document.getElementById("force-refresh-btn").addEventListener("click",forceRefresh)});
     </script></body></html>
 EOF
@@ -532,7 +833,7 @@ cat << 'EOF' > README.md
 - **인터랙티브 이벤트 조회**: 대시보드의 비정상 Pod 이름을 클릭하여 상세한 실패 원인이 담긴 이벤트 로그를 팝업으로 즉시 확인할 수 있습니다.
 - **할당된 노드 정보 표시**: 모든 Pod 목록에 해당 Pod가 스케줄링된 **Node의 이름**이 표시됩니다.
 - **Docker 기반 완벽한 배포**: `docker-compose up` 단 한 줄로 모든 의존성(Python, Rust, kubectl) 설치, 빌드, 실행이 완료됩니다.
-- **OIDC/Keycloak 인증 자동화**: 스크립트 실행 시 **자동으로 `kubectl`을 호출**하여 인증 토큰을 갱신합니다.
+- **OIDC/Keycloak 인증 자동화**: kubeconfig 로더가 **프로세스 내에서 인증 토큰을 자동 갱신**하며, 인증이 만료(401)되면 클라이언트를 다시 만들어 재시도합니다. `kubectl`은 exec 인증 플러그인을 쓰는 kubeconfig에서만 필요합니다.
 - **정확한 탐지 로직**: Pod의 `phase`와 각 컨테이너의 `ready` 상태까지 점검하여 `CrashLoopBackOff` 등의 문제를 정확히 탐지합니다.
 
 ## 🔧 설치 및 실행
@@ -7,17 +7,33 @@ Kubernetes Pod Abnormality Monitor
 """
 
 import os
+import json
 import logging
-from dataclasses import dataclass, asdict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Iterator, Sequence, Union
 from enum import Enum
+from functools import lru_cache
 
 from kubernetes import config, client
 from kubernetes.client.rest import ApiException
 import requests
 
+logger = logging.getLogger(__name__)
+
+POD_LIST_PAGE_SIZE = 500
+API_CONNECTION_POOL_SIZE = 32
+# Succeeded Pod는 분석 대상이 아니므로 서버 측에서 제외 (Running은 Ready 점검을 위해 유지)
+POD_FIELD_SELECTOR = "status.phase!=Succeeded"
+
+# 컨텍스트별 CoreV1Api 캐시 (실행 간 HTTPS 연결 풀 재사용)
+_CLIENT_CACHE: Dict[str, client.CoreV1Api] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
 
 class PodStatus(Enum):
     """Pod 상태 열거형"""
@@ -29,7 +45,18 @@ class PodStatus(Enum):
     UNEXPECTED_ERROR = "UNEXPECTED_ERROR"
 
 
-@dataclass
+# 분석 루프에서 Enum 속성 조회를 피하기 위한 Phase 상수
+_PHASE_RUNNING = "Running"
+_PHASE_PENDING = PodStatus.PENDING.value
+_PHASE_FAILED_OR_UNKNOWN = (PodStatus.FAILED.value, PodStatus.UNKNOWN.value)
+
+# 비정상으로 판단하는 컨테이너 상태 사유
+_WAITING_BAD = frozenset({"CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"})
+_TERMINATED_BAD = frozenset({"Error", "OOMKilled"})
+_PENDING_WAIT = frozenset({"ImagePullBackOff", "ErrImagePull", "ContainerCreating"})
+
+
+@dataclass(slots=True)
 class Config:
     """애플리케이션 설정"""
     long_term_pending_threshold_minutes: int = 10
@@ -38,7 +65,7 @@ class Config:
     log_level: str = "INFO"
 
 
-@dataclass
+@dataclass(slots=True)
 class AbnormalPodInfo:
     """비정상 Pod 정보를 담는 데이터 클래스"""
     timestamp: str
@@ -47,49 +74,100 @@ class AbnormalPodInfo:
     pod_name: str
     status: str
     node: str
-    abnormal_reasons: str
+    abnormal_reasons: Union[str, Sequence[str]]  # 목록이면 최초 사용 시 "; "로 결합
+    _reasons_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def reasons_text(self) -> str:
+        """비정상 원인을 한 줄로 결합 (결과를 보관해 Pod당 한 번만 결합)"""
+        if self._reasons_text is None:
+            reasons = self.abnormal_reasons
+            self._reasons_text = reasons if isinstance(reasons, str) else "; ".join(reasons)
+        return self._reasons_text
 
     def to_log_line(self) -> str:
         """로그 파일 형식으로 변환"""
-        return (
-            f"{self.timestamp} | "
-            f"{self.cluster_name} | "
-            f"{self.namespace} | "
-            f"{self.pod_name} | "
-            f"{self.status} | "
-            f"{self.node} | "
-            f"{self.abnormal_reasons}\n"
-        )
+        return f"{self.timestamp} | {self.cluster_name} | {self.namespace} | {self.pod_name} | {self.status} | {self.node} | {self.reasons_text}\n"
+
+
+@lru_cache(maxsize=None)
+def _camel_case(name: str) -> str:
+    head, *rest = name.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+class K8sObject:
+    """API 응답 dict를 모델 객체처럼 속성으로 접근하기 위한 경량 래퍼 (snake_case -> camelCase)"""
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        value = self._data.get(_camel_case(name))
+        if isinstance(value, dict):
+            return K8sObject(value)
+        if isinstance(value, list):
+            return [K8sObject(item) if isinstance(item, dict) else item for item in value]
+        return value
 
 
 class KubernetesClient:
     """Kubernetes API 클라이언트 래퍼"""
     
-    def __init__(self, context_name: str, timeout: int):
+    def __init__(self, context_name: str, timeout: int, kubeconfig: Optional[Any] = None):
         self.context_name = context_name
         self.timeout = timeout
-        self._client = None
+        self.kubeconfig = kubeconfig
+        with _CLIENT_CACHE_LOCK:
+            self._client = _CLIENT_CACHE.get(context_name)
     
     def connect(self) -> bool:
         """클러스터에 연결"""
+        if self._client:
+            return True
         try:
-            config.load_kube_config(context=self.context_name)
-            self._client = client.CoreV1Api()
+            # 컨텍스트마다 독립된 Configuration 사용 (전역 기본 설정을 공유하지 않음)
+            configuration = client.Configuration()
+            if self.kubeconfig is not None:
+                # 미리 파싱된 kubeconfig 사용 (파일 재조회/YAML 재파싱 없음)
+                config.kube_config.KubeConfigLoader(
+                    config_dict=self.kubeconfig, config_base_path=None, active_context=self.context_name
+                ).load_and_set(configuration)
+            else:
+                config.load_kube_config(context=self.context_name, client_configuration=configuration, persist_config=False)
+            configuration.connection_pool_maxsize = API_CONNECTION_POOL_SIZE
+            self._client = client.CoreV1Api(client.ApiClient(configuration))
+            with _CLIENT_CACHE_LOCK:
+                _CLIENT_CACHE[self.context_name] = self._client
             return True
         except Exception as e:
-            logging.error(f"Failed to connect to cluster {self.context_name}: {e}")
+            logger.error("Failed to connect to cluster %s: %s", self.context_name, e)
             return False
     
-    def list_all_pods(self) -> Optional[client.V1PodList]:
+    def list_all_pods(self, field_selector: Optional[str] = None) -> Optional[List[K8sObject]]:
         """모든 네임스페이스의 Pod 목록을 가져옴"""
         if not self._client:
             return None
         
+        # 모델 역직렬화를 건너뛰고 응답 JSON을 직접 파싱, 페이지 단위로 조회
+        pods = []
+        _continue = None
         try:
-            return self._client.list_pod_for_all_namespaces(
-                watch=False, 
-                _request_timeout=self.timeout
-            )
+            while True:
+                response = self._client.list_pod_for_all_namespaces(
+                    watch=False,
+                    field_selector=field_selector,
+                    limit=POD_LIST_PAGE_SIZE,
+                    _continue=_continue,
+                    _preload_content=False,
+                    _request_timeout=self.timeout
+                )
+                page = json.loads(response.data)
+                pods.extend(K8sObject(item) for item in page.get('items') or ())
+                _continue = page['metadata'].get('continue')
+                if not _continue:
+                    return pods
         except requests.exceptions.Timeout:
             raise TimeoutError(f"API call timed out after {self.timeout} seconds")
         except ApiException as e:
@@ -102,24 +180,31 @@ class PodAnalyzer:
     def __init__(self, pending_threshold_minutes: int):
         self.pending_threshold_minutes = pending_threshold_minutes
     
-    def is_pod_abnormal(self, pod: client.V1Pod) -> List[str]:
-        """Pod가 비정상 상태인지 확인하고 이유를 반환"""
+    def is_pod_abnormal(self, pod: K8sObject, current_time: datetime) -> List[str]:
+        """Pod가 비정상 상태인지 확인하고 이유를 반환 (current_time: 점검 기준 시각, UTC)"""
+        # 빠른 경로: 모든 컨테이너가 Ready인 Running Pod (대부분의 Pod)
+        status = pod.status
+        if status.phase == _PHASE_RUNNING:
+            container_statuses = status.container_statuses
+            if not container_statuses or all(cs.ready for cs in container_statuses):
+                return []
+        
         abnormal_reasons = []
         
         # Phase 기반 분석
-        abnormal_reasons.extend(self._analyze_pod_phase(pod))
+        abnormal_reasons.extend(self._analyze_pod_phase(pod, current_time))
         
         # 컨테이너 상태 분석
         abnormal_reasons.extend(self._analyze_container_statuses(pod))
         
         return abnormal_reasons
     
-    def _analyze_pod_phase(self, pod: client.V1Pod) -> List[str]:
+    def _analyze_pod_phase(self, pod: K8sObject, current_time: datetime) -> List[str]:
         """Pod Phase 분석"""
         reasons = []
         phase = pod.status.phase
         
-        if phase in [PodStatus.FAILED.value, PodStatus.UNKNOWN.value]:
+        if phase in _PHASE_FAILED_OR_UNKNOWN:
             reason_text = f"Phase: {phase}"
             if pod.status.reason:
                 reason_text += f" ({pod.status.reason})"
@@ -127,17 +212,17 @@ class PodAnalyzer:
                 reason_text += f" - {pod.status.message}"
             reasons.append(reason_text)
             
-        elif phase == PodStatus.PENDING.value:
-            reasons.extend(self._analyze_pending_pod(pod))
+        elif phase == _PHASE_PENDING:
+            reasons.extend(self._analyze_pending_pod(pod, current_time))
         
         return reasons
     
-    def _get_container_state(self, state: Optional[client.V1ContainerState]) -> str:
+    def _get_container_state(self, state: Optional[K8sObject]) -> str:
         """컨테이너 상태를 안전하게 가져오기"""
         if not state:
             return 'Unknown'
         
-        # V1ContainerState의 각 상태를 직접 확인
+        # ContainerState의 각 상태를 직접 확인
         if state.running:
             return 'Running'
         elif state.waiting:
@@ -147,16 +232,16 @@ class PodAnalyzer:
         else:
             return 'Unknown'
     
-    def _analyze_pending_pod(self, pod: client.V1Pod) -> List[str]:
+    def _analyze_pending_pod(self, pod: K8sObject, current_time: datetime) -> List[str]:
         """Pending 상태 Pod 분석"""
         reasons = []
         
         # 장시간 대기 체크
         try:
-            creation_time = datetime.fromisoformat(
-                pod.metadata.creation_timestamp.replace('Z', '+00:00')
-            )
-            current_time = datetime.now(timezone.utc)
+            # 모델 역직렬화된 경우 이미 datetime, 원본 JSON이면 ISO 문자열
+            creation_time = pod.metadata.creation_timestamp
+            if not isinstance(creation_time, datetime):
+                creation_time = datetime.fromisoformat(creation_time.replace('Z', '+00:00'))
             pending_duration = current_time - creation_time
             
             if pending_duration.total_seconds() > (self.pending_threshold_minutes * 60):
@@ -174,69 +259,81 @@ class PodAnalyzer:
         
         return reasons
     
-    def _analyze_pending_conditions(self, pod: client.V1Pod) -> List[str]:
+    def _analyze_pending_conditions(self, pod: K8sObject) -> List[str]:
         """Pending Pod의 조건 분석"""
         reasons = []
+        status = pod.status
         
         # Pod 조건 확인
-        if pod.status.conditions:
-            for condition in pod.status.conditions:
-                if condition.type == "PodScheduled" and condition.status == "False":
+        conditions = status.conditions
+        if conditions:
+            for condition in conditions:
+                condition_type = condition.type
+                if condition.status != "False":
+                    continue
+                if condition_type == "PodScheduled":
                     reasons.append(
                         f"Phase: Pending - Not Scheduled ({condition.reason}: {condition.message})"
                     )
-                elif condition.type == "Initialized" and condition.status == "False":
+                elif condition_type == "Initialized":
                     reasons.append(
                         f"Phase: Pending - Not Initialized ({condition.reason}: {condition.message})"
                     )
         
         # 컨테이너 대기 상태 확인
-        if not reasons and pod.status.container_statuses:
-            for container_status in pod.status.container_statuses:
-                if container_status.state and container_status.state.waiting:
-                    reason = container_status.state.waiting.reason
-                    message = container_status.state.waiting.message or ""
-                    if reason in ["ImagePullBackOff", "ErrImagePull", "ContainerCreating"]:
+        container_statuses = status.container_statuses
+        if not reasons and container_statuses:
+            for container_status in container_statuses:
+                state = container_status.state
+                waiting = state.waiting if state else None
+                if waiting:
+                    reason = waiting.reason
+                    message = waiting.message or ""
+                    if reason in _PENDING_WAIT:
                         reasons.append(
                             f"Phase: Pending - Container Waiting ({reason}: {message})"
                         )
         
         return reasons
     
-    def _analyze_container_statuses(self, pod: client.V1Pod) -> List[str]:
+    def _analyze_container_statuses(self, pod: K8sObject) -> List[str]:
         """컨테이너 상태 분석"""
         reasons = []
         
-        if not pod.status.container_statuses:
+        container_statuses = pod.status.container_statuses
+        if not container_statuses:
             return reasons
         
-        for container_status in pod.status.container_statuses:
+        for container_status in container_statuses:
             container_name = container_status.name
+            # 반복되는 속성 체인 대신 지역 변수로 한 번만 조회
+            state = container_status.state
+            waiting = state.waiting if state else None
+            terminated = state.terminated if state else None
+            ready = container_status.ready
             
             # Waiting 상태 분석
-            if container_status.state and container_status.state.waiting:
-                reason = container_status.state.waiting.reason
-                message = container_status.state.waiting.message or ""
-                if reason in ["CrashLoopBackOff", "ImagePullBackOff", "ErrImagePull"]:
+            if waiting:
+                reason = waiting.reason
+                message = waiting.message or ""
+                if reason in _WAITING_BAD:
                     reasons.append(
                         f"Container '{container_name}' Waiting: {reason} - {message}"
                     )
             
             # Terminated 상태 분석
-            if container_status.state and container_status.state.terminated:
-                terminated = container_status.state.terminated
-                if (terminated.reason in ["Error", "OOMKilled"] or 
-                    (terminated.exit_code is not None and terminated.exit_code != 0)):
+            if terminated:
+                exit_code = terminated.exit_code
+                if (terminated.reason in _TERMINATED_BAD or 
+                    (exit_code is not None and exit_code != 0)):
                     reasons.append(
                         f"Container '{container_name}' Terminated: {terminated.reason} "
-                        f"(Exit Code: {terminated.exit_code}) - {terminated.message or ''}"
+                        f"(Exit Code: {exit_code}) - {terminated.message or ''}"
                     )
             
             # Ready 상태 분석
-            if (container_status.ready is False and 
-                not (container_status.state and 
-                     (container_status.state.waiting or container_status.state.terminated))):
-                current_state = self._get_container_state(container_status.state)
+            if ready is False and not (waiting or terminated):
+                current_state = self._get_container_state(state)
                 reasons.append(
                     f"Container '{container_name}' Not Ready (Current State: {current_state})"
                 )
@@ -250,61 +347,79 @@ class ClusterMonitor:
     def __init__(self, config: Config):
         self.config = config
         self.analyzer = PodAnalyzer(config.long_term_pending_threshold_minutes)
+        self._kubeconfig = None
     
     def get_kubeconfig_contexts(self) -> List[str]:
-        """kubeconfig에서 컨텍스트 목록 가져오기"""
+        """kubeconfig에서 컨텍스트 목록 가져오기 (파싱 결과는 클러스터 연결 시 재사용)"""
         try:
-            contexts, _ = config.list_kube_config_contexts()
+            kubeconfig = config.kube_config.KubeConfigMerger(config.kube_config.KUBE_CONFIG_DEFAULT_LOCATION).config
+            if not kubeconfig:
+                raise config.ConfigException("Invalid kube-config file. No configuration found.")
+            contexts = config.kube_config.KubeConfigLoader(config_dict=kubeconfig, config_base_path=None).list_contexts()
+            self._kubeconfig = kubeconfig
             return [context['name'] for context in contexts]
         except config.ConfigException as e:
-            logging.error(f"kubeconfig 파일을 찾거나 읽을 수 없습니다: {e}")
+            logger.error("kubeconfig 파일을 찾거나 읽을 수 없습니다: %s", e)
             return []
     
-    def check_cluster(self, context_name: str) -> List[AbnormalPodInfo]:
-        """단일 클러스터의 비정상 Pod 확인"""
-        logging.info(f"클러스터 '{context_name}' 점검 시작")
+    def check_cluster(self, context_name: str,
+                      write_batch: Optional[Callable[[List[AbnormalPodInfo]], None]] = None) -> Optional[List[AbnormalPodInfo]]:
+        """단일 클러스터의 비정상 Pod 확인 (write_batch가 주어지면 결과를 바로 기록하고 None 반환)"""
+        abnormal_pods = self._check_cluster(context_name)
+        if write_batch:
+            # 기록 후 목록을 반환하지 않아, 완료된 Future가 클러스터별 결과를 붙잡아 두지 않도록 함
+            write_batch(abnormal_pods)
+            return None
+        return abnormal_pods
+    
+    def _check_cluster(self, context_name: str) -> List[AbnormalPodInfo]:
+        """단일 클러스터 점검 수행"""
+        logger.info("클러스터 '%s' 점검 시작", context_name)
+        
+        k8s_client = KubernetesClient(context_name, self.config.api_call_timeout_seconds, self._kubeconfig)
         
-        k8s_client = KubernetesClient(context_name, self.config.api_call_timeout_seconds)
+        # 점검 기준 시각은 클러스터당 한 번만 계산
+        current_time = datetime.now(timezone.utc)
+        ts_str = current_time.astimezone().strftime("%Y-%m-%d %H:%M:%S")
         
         if not k8s_client.connect():
-            return [self._create_error_pod_info(context_name, "CONNECTION_ERROR", "Failed to connect")]
+            return [self._create_error_pod_info(context_name, "CONNECTION_ERROR", "Failed to connect", ts_str)]
         
         try:
-            pods = k8s_client.list_all_pods()
-            if not pods or not pods.items:
-                logging.info(f"클러스터 '{context_name}'에 Pod가 없습니다")
+            pods = k8s_client.list_all_pods(field_selector=POD_FIELD_SELECTOR)
+            if not pods:
+                logger.info("클러스터 '%s'에 Pod가 없습니다", context_name)
                 return []
             
-            return self._analyze_pods(context_name, pods.items)
+            return self._analyze_pods(context_name, pods, current_time, ts_str)
             
         except TimeoutError as e:
-            logging.error(f"클러스터 '{context_name}' 타임아웃: {e}")
-            return [self._create_error_pod_info(context_name, "CONNECTION_TIMEOUT", str(e))]
+            logger.error("클러스터 '%s' 타임아웃: %s", context_name, e)
+            return [self._create_error_pod_info(context_name, "CONNECTION_TIMEOUT", str(e), ts_str)]
             
         except ApiException as e:
-            logging.error(f"클러스터 '{context_name}' API 오류: {e}")
-            return [self._create_error_pod_info(context_name, "API_ERROR", f"{e.status} - {e.reason}")]
+            logger.error("클러스터 '%s' API 오류: %s", context_name, e)
+            return [self._create_error_pod_info(context_name, "API_ERROR", f"{e.status} - {e.reason}", ts_str)]
             
         except Exception as e:
-            logging.error(f"클러스터 '{context_name}' 예기치 못한 오류: {e}")
-            return [self._create_error_pod_info(context_name, "UNEXPECTED_ERROR", str(e))]
+            logger.error("클러스터 '%s' 예기치 못한 오류: %s", context_name, e)
+            return [self._create_error_pod_info(context_name, "UNEXPECTED_ERROR", str(e), ts_str)]
     
-    def _analyze_pods(self, context_name: str, pods: List[client.V1Pod]) -> List[AbnormalPodInfo]:
+    def _analyze_pods(self, context_name: str, pods: List[K8sObject], current_time: datetime, ts_str: str) -> List[AbnormalPodInfo]:
         """Pod 목록 분석"""
         abnormal_pods = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         for pod in pods:
-            abnormal_reasons = self.analyzer.is_pod_abnormal(pod)
+            abnormal_reasons = self.analyzer.is_pod_abnormal(pod, current_time)
             if abnormal_reasons:
                 pod_info = AbnormalPodInfo(
-                    timestamp=current_time,
+                    timestamp=ts_str,
                     cluster_name=context_name,
                     namespace=pod.metadata.namespace,
                     pod_name=pod.metadata.name,
                     status=pod.status.phase,
                     node=pod.spec.node_name or 'N/A',
-                    abnormal_reasons="; ".join(abnormal_reasons)
+                    abnormal_reasons=abnormal_reasons
                 )
                 abnormal_pods.append(pod_info)
                 
@@ -312,14 +427,14 @@ class ClusterMonitor:
                 self._log_abnormal_pod(pod_info)
         
         if not abnormal_pods:
-            logging.info(f"클러스터 '{context_name}'에서 비정상 Pod를 찾지 못했습니다")
+            logger.info("클러스터 '%s'에서 비정상 Pod를 찾지 못했습니다", context_name)
         
         return abnormal_pods
     
-    def _create_error_pod_info(self, context_name: str, status: str, reason: str) -> AbnormalPodInfo:
+    def _create_error_pod_info(self, context_name: str, status: str, reason: str, ts_str: str) -> AbnormalPodInfo:
         """오류 상황용 Pod 정보 생성"""
         return AbnormalPodInfo(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            timestamp=ts_str,
             cluster_name=context_name,
             namespace="N/A",
             pod_name="N/A",
@@ -330,10 +445,13 @@ class ClusterMonitor:
     
     def _log_abnormal_pod(self, pod_info: AbnormalPodInfo):
         """비정상 Pod 정보 콘솔 출력"""
-        logging.warning(f"[경고] Pod: {pod_info.pod_name} (Namespace: {pod_info.namespace})")
-        logging.warning(f"  - Node: {pod_info.node}")
-        logging.warning(f"  - Status: {pod_info.status}")
-        logging.warning(f"  - 비정상 원인: {pod_info.abnormal_reasons}")
+        # Pod당 한 번의 로깅 호출, 비활성 시 포맷팅 생략
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        logger.warning(
+            "[경고] Pod: %s (Namespace: %s)\n  - Node: %s\n  - Status: %s\n  - 비정상 원인: %s",
+            pod_info.pod_name, pod_info.namespace, pod_info.node, pod_info.status, pod_info.reasons_text
+        )
 
 
 class ResultSaver:
@@ -343,23 +461,42 @@ class ResultSaver:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
     
-    def save_results(self, abnormal_pods: List[AbnormalPodInfo]):
-        """결과를 파일로 저장"""
-        if not abnormal_pods:
-            logging.info("저장할 비정상 Pod 데이터가 없습니다")
-            return
-        
+    @contextmanager
+    def open(self) -> Iterator[Callable[[List[AbnormalPodInfo]], None]]:
+        """실행 동안 출력 파일을 열어 두고, 클러스터별 결과를 바로 기록하는 write_batch 함수를 제공"""
         file_path = self._get_output_file_path()
+        lock = threading.Lock()
+        state = {"file": None, "count": 0}
+        
+        def write_batch(abnormal_pods: List[AbnormalPodInfo]):
+            if not abnormal_pods:
+                return
+            # 배치의 로그 라인을 한 번에 인코딩해 단일 write로 추가 (버퍼 없이 바로 디스크로)
+            payload = "".join(pod_info.to_log_line() for pod_info in abnormal_pods).encode('utf-8')
+            with lock:
+                try:
+                    if state["file"] is None:
+                        state["file"] = open(file_path, 'ab', buffering=0)
+                    state["file"].write(payload)
+                    state["count"] += len(abnormal_pods)
+                except IOError as e:
+                    logger.error("파일 저장 중 오류 발생: %s", e)
         
         try:
-            with open(file_path, 'a', encoding='utf-8') as f:
-                for pod_info in abnormal_pods:
-                    f.write(pod_info.to_log_line())
-            
-            logging.info(f"데이터가 성공적으로 {file_path}에 저장되었습니다")
-            
-        except IOError as e:
-            logging.error(f"파일 저장 중 오류 발생: {e}")
+            yield write_batch
+        finally:
+            if state["file"] is not None:
+                state["file"].close()
+        
+        if state["count"]:
+            logger.info("데이터가 성공적으로 %s에 저장되었습니다", file_path)
+        else:
+            logger.info("저장할 비정상 Pod 데이터가 없습니다")
+    
+    def save_results(self, abnormal_pods: List[AbnormalPodInfo]):
+        """결과를 파일로 저장"""
+        with self.open() as write_batch:
+            write_batch(abnormal_pods)
     
     def _get_output_file_path(self) -> Path:
         """출력 파일 경로 생성"""
@@ -389,19 +526,19 @@ class PodMonitorApp:
         contexts = self.monitor.get_kubeconfig_contexts()
         
         if not contexts:
-            logging.error("조회할 Kubernetes 클러스터 컨텍스트가 없습니다")
+            logger.error("조회할 Kubernetes 클러스터 컨텍스트가 없습니다")
             return
         
-        logging.info(f"발견된 Kubernetes 컨텍스트: {', '.join(contexts)}")
-        
-        all_abnormal_pods = []
+        logger.info("발견된 Kubernetes 컨텍스트: %s", ", ".join(contexts))
         
-        for context in contexts:
-            abnormal_pods = self.monitor.check_cluster(context)
-            all_abnormal_pods.extend(abnormal_pods)
-        
-        logging.info("모든 클러스터 점검 완료")
-        self.saver.save_results(all_abnormal_pods)
+        # 클러스터별 점검은 네트워크 I/O 위주이므로 병렬로 실행하고, 결과는 클러스터마다 바로 기록
+        with self.saver.open() as write_batch:
+            with ThreadPoolExecutor(max_workers=min(32, len(contexts))) as executor:
+                futures = {executor.submit(self.monitor.check_cluster, context, write_batch): context for context in contexts}
+                for future in as_completed(futures):
+                    future.result()
+            
+            logger.info("모든 클러스터 점검 완료")
 
 
 def main():